@@ -19,6 +19,10 @@ Base utilities to build API operation managers and objects on top of.
 
 import abc
 import copy
+import functools
+import sys
+import threading
+
 import six
 
 import six.moves.urllib.parse as urlparse
@@ -39,10 +43,151 @@ def getid(obj):
         return obj
 
 
+class FieldProfile(object):
+    """Records which resource attributes callers read.
+
+    When a FieldProfile is set as the ``field_profile`` of a manager, the
+    resources returned by the manager's ``list()`` and ``get()`` methods
+    record every attribute that is read from them. The records are kept
+    per profile key: either an explicit profile name, or by default the
+    call site (file and line) of the ``list()``/``get()`` call.
+
+    A frozen profile no longer records anything; instead, calls that do not
+    ask for specific fields only request the fields recorded for their key,
+    using the 'fields' parameter (requires API version 1.8 or newer). An
+    unfrozen profile does the same once a key has been recorded for
+    ``warmup`` calls; attributes that are then missing from the narrowed
+    responses are recorded too and requested on later calls.
+
+    :param fields: Optional, a dictionary mapping profile keys to lists of
+                   fields, as returned by :meth:`export`.
+    :param name: Optional, a profile name used instead of the call site to
+                 build the profile keys.
+    :param frozen: Whether the profile is frozen.
+    :param warmup: Optional, the number of recorded calls after which an
+                   unfrozen profile starts narrowing requests. None (the
+                   default) never narrows requests until frozen.
+    """
+
+    def __init__(self, fields=None, name=None, frozen=False, warmup=None):
+        self.name = name
+        self.frozen = frozen
+        self.warmup = warmup
+        self._fields = dict((k, set(v)) for k, v in (fields or {}).items())
+        self._calls = dict((k, 0) for k in self._fields)
+        self._lock = threading.Lock()
+
+    def key(self, resource_name, method, skip_modules=()):
+        """Build the profile key for a manager call.
+
+        :param resource_name: The name of the resource, eg 'nodes'.
+        :param method: The name of the manager method, eg 'list'.
+        :param skip_modules: Names of the modules whose frames are not
+                             considered as the call site.
+        """
+        if self.name is not None:
+            return '%s:%s.%s' % (self.name, resource_name, method)
+        frame = sys._getframe(1)
+        while (frame.f_back is not None and
+               (frame.f_globals.get('__name__') == __name__ or
+                frame.f_globals.get('__name__') in skip_modules)):
+            frame = frame.f_back
+        return '%s:%d:%s.%s' % (frame.f_code.co_filename, frame.f_lineno,
+                                resource_name, method)
+
+    def fields(self, key):
+        """Return the fields to request for a profile key.
+
+        :param key: A profile key, as built by :meth:`key`.
+        :returns: A sorted list of fields, or None if requests for this key
+                  should not be narrowed.
+        """
+        with self._lock:
+            recorded = self._fields.get(key)
+            if not recorded:
+                return None
+            if not self.frozen and (self.warmup is None or
+                                    self._calls[key] < self.warmup):
+                return None
+            # NOTE: always fetch the identifier so that projected resources
+            # can still be told apart.
+            return sorted(recorded | set(['uuid']))
+
+    def start(self, key):
+        """Count a call for a profile key."""
+        if self.frozen:
+            return
+        with self._lock:
+            self._fields.setdefault(key, set())
+            self._calls[key] = self._calls.get(key, 0) + 1
+
+    def record(self, key, field):
+        """Record that a field was read from a resource."""
+        if self.frozen:
+            return
+        with self._lock:
+            self._fields.setdefault(key, set()).add(field)
+
+    def freeze(self):
+        """Stop recording and narrow all requests with a recorded key."""
+        self.frozen = True
+
+    def export(self):
+        """Export the recorded fields.
+
+        :returns: A dictionary mapping profile keys to sorted lists of
+                  fields, suitable for JSON serialization and for the
+                  ``fields`` argument of this class.
+        """
+        with self._lock:
+            return dict((k, sorted(v)) for k, v in self._fields.items() if v)
+
+
+class _RecordingResource(object):
+    """Mixin for resources that record the attributes read from them."""
+
+    def __getattribute__(self, name):
+        if name[0] != '_':
+            attrs = object.__getattribute__(self, '__dict__')
+            recorder = attrs.get('_field_recorder')
+            if recorder is not None and name in attrs.get('_info', ()):
+                recorder(name)
+        return super(_RecordingResource, self).__getattribute__(name)
+
+    def __getattr__(self, name):
+        recorder = self.__dict__.get('_field_recorder')
+        if recorder is not None and name[0] != '_':
+            recorder(name)
+        return super(_RecordingResource, self).__getattr__(name)
+
+    def to_dict(self):
+        recorder = self.__dict__.get('_field_recorder')
+        if recorder is not None:
+            for name in self._info:
+                recorder(name)
+        return super(_RecordingResource, self).to_dict()
+
+
+_recording_classes = {}
+
+
+def _recording_class(obj_class):
+    try:
+        return _recording_classes[obj_class]
+    except KeyError:
+        cls = type(obj_class.__name__, (_RecordingResource, obj_class), {})
+        _recording_classes[obj_class] = cls
+        return cls
+
+
 @six.add_metaclass(abc.ABCMeta)
 class Manager(object):
     """Provides  CRUD operations with a particular API."""
 
+    # NOTE: set to a FieldProfile to record the attributes read from the
+    # resources returned by list() and get(); see FieldProfile.
+    field_profile = None
+
     def __init__(self, api):
         self.api = api
 
@@ -67,19 +212,61 @@ class Manager(object):
 
         """
 
+    def _profile_fields(self, method, fields=None, detail=False):
+        """Apply the field profile to a list() or get() call.
+
+        :param method: The name of the manager method, eg 'list'.
+        :param fields: The fields requested by the caller.
+        :param detail: Whether the caller requested detailed information.
+        :returns: A tuple of (fields, detail, profile_key) to use for the
+                  request. profile_key is None if the returned resources
+                  should not record the attributes read from them.
+        """
+        profile = self.field_profile
+        if profile is None or fields is not None:
+            return fields, detail, None
+
+        key = profile.key(self._resource_name, method,
+                          skip_modules=(type(self).__module__,))
+        profile.start(key)
+        profiled = profile.fields(key)
+        if profiled:
+            return profiled, False, key
+        return fields, detail, key
+
+    def _make_resources(self, obj_class, data, profile_key=None):
+        if profile_key is None:
+            return [obj_class(self, obj, loaded=True) for obj in data]
+
+        profile = self.field_profile
+        recording_class = _recording_class(obj_class)
+        resources = []
+        for obj in data:
+            resource = recording_class(self, obj, loaded=True)
+            resource._field_recorder = functools.partial(profile.record,
+                                                         profile_key)
+            resources.append(resource)
+        return resources
+
     def _get(self, resource_id, fields=None):
         """Retrieve a resource.
 
         :param resource_id: Identifier of the resource.
         :param fields: List of specific fields to be returned.
         """
+        profile_key = None
+        # NOTE: paths to sub-resources (eg '<node>/states') are not
+        # resources with fields, so they are never profiled.
+        if '/' not in str(resource_id):
+            fields, _detail, profile_key = self._profile_fields('get', fields)
 
         if fields is not None:
             resource_id = '%s?fields=' % resource_id
             resource_id += ','.join(fields)
 
         try:
-            return self._list(self._path(resource_id))[0]
+            return self._list(self._path(resource_id),
+                              profile_key=profile_key)[0]
         except IndexError:
             return None
 
@@ -98,7 +285,7 @@ class Manager(object):
         return data
 
     def _list_pagination(self, url, response_key=None, obj_class=None,
-                         limit=None):
+                         limit=None, profile_key=None):
         """Retrieve a list of items.
 
         The Ironic API is configured to return a maximum number of
@@ -114,6 +301,8 @@ class Manager(object):
         :param obj_class: class for constructing the returned objects.
         :param limit: maximum number of items to return. If None returns
             everything.
+        :param profile_key: the field profile key of the call, if the
+            returned objects should record the attributes read from them.
 
         """
         if obj_class is None:
@@ -128,8 +317,8 @@ class Manager(object):
         while url:
             resp, body = self.api.json_request('GET', url)
             data = self._format_body_data(body, response_key)
-            for obj in data:
-                object_list.append(obj_class(self, obj, loaded=True))
+            for obj in self._make_resources(obj_class, data, profile_key):
+                object_list.append(obj)
                 object_count += 1
                 if limit and object_count >= limit:
                     # break the for loop
@@ -150,14 +339,16 @@ class Manager(object):
 
         return object_list
 
-    def _list(self, url, response_key=None, obj_class=None, body=None):
+    def _list(self, url, response_key=None, obj_class=None, body=None,
+              profile_key=None):
         resp, body = self.api.json_request('GET', url)
 
         if obj_class is None:
             obj_class = self.resource_class
 
         data = self._format_body_data(body, response_key)
-        return [obj_class(self, res, loaded=True) for res in data if res]
+        return self._make_resources(obj_class, [res for res in data if res],
+                                    profile_key)
 
     def _update(self, resource_id, patch, method='PATCH'):
         """Update a resource.
@@ -18,8 +18,10 @@
 
 from __future__ import print_function
 
+import csv
 import getpass
 import inspect
+import json
 import os
 import sys
 import textwrap
@@ -138,8 +140,93 @@ def isunauthenticated(func):
     return getattr(func, 'unauthenticated', False)
 
 
+# NOTE: output formats accepted by print_list(); every format but a sorted
+# table is rendered row by row, as the objects are iterated.
+OUTPUT_FORMATS = ('table', 'json', 'jsonl', 'csv', 'value')
+
+# Number of rows used to size the columns of a streamed table.
+STREAM_SAMPLE_SIZE = 100
+
+
+def output_format_arg(func):
+    """Adds the '--format' argument of print_list() to a shell function."""
+    add_arg(func, '--format',
+            dest='output_format',
+            metavar='<format>',
+            choices=OUTPUT_FORMATS,
+            default='table',
+            help='Output format: %s. Defaults to "table".' %
+                 pretty_choice_list(OUTPUT_FORMATS))
+    return func
+
+
+def _print(text):
+    if six.PY3:
+        print(encodeutils.safe_encode(text).decode())
+    else:
+        print(encodeutils.safe_encode(text))
+
+
+def _iter_rows(objs, fields, formatters, mixed_case_fields):
+    for o in objs:
+        row = []
+        for field in fields:
+            if field in formatters:
+                row.append(formatters[field](o))
+            else:
+                if field in mixed_case_fields:
+                    field_name = field.replace(' ', '_')
+                else:
+                    field_name = field.lower().replace(' ', '_')
+                if isinstance(o, dict):
+                    data = o.get(field_name, '')
+                else:
+                    data = getattr(o, field_name, '')
+                row.append(data)
+        yield row
+
+
+def _print_stream_table(rows, field_labels, sample_size):
+    # NOTE: the column widths are fixed from the first sample_size rows;
+    # wider values found later overflow their cell instead of delaying the
+    # output until all the rows are known.
+    sample = []
+    for row in rows:
+        sample.append([six.text_type(v) for v in row])
+        if len(sample) >= sample_size:
+            break
+
+    widths = [len(six.text_type(label)) for label in field_labels]
+    for row in sample:
+        widths = [max(w, len(v)) for w, v in zip(widths, row)]
+
+    border = '+' + '+'.join('-' * (w + 2) for w in widths) + '+'
+
+    def line(values):
+        return '| ' + ' | '.join(six.text_type(v).ljust(w)
+                                 for v, w in zip(values, widths)) + ' |'
+
+    _print(border)
+    _print(line(field_labels))
+    _print(border)
+    for row in sample:
+        _print(line(row))
+    for row in rows:
+        _print(line(row))
+    _print(border)
+
+
+def _print_csv(rows, field_labels):
+    writer = csv.writer(sys.stdout, lineterminator='\n')
+    writer.writerow(field_labels)
+    for row in rows:
+        writer.writerow([v if isinstance(v, six.string_types)
+                         else json.dumps(v) for v in row])
+
+
 def print_list(objs, fields, formatters=None, sortby_index=0,
-               mixed_case_fields=None, field_labels=None):
+               mixed_case_fields=None, field_labels=None,
+               output_format='table', stream=False):
     """Print a list of objects or dict as a table, one row per object or dict.
 
     :param objs: iterable of :class:`Resource`
@@ -150,6 +237,14 @@ def print_list(objs, fields, formatters=None, sortby_index=0,
         have mixed case names (e.g., 'serverId')
     :param field_labels: Labels to use in the heading of the table, default to
         fields.
+    :param output_format: One of OUTPUT_FORMATS: 'table' (the default);
+        'json', a list of objects keyed by field; 'jsonl', one such object
+        per line; 'csv', with field_labels as the header; or 'value', the
+        space-separated values without any header.
+    :param stream: Whether a table should be printed while iterating over
+        objs, with column widths sampled from the first rows, instead of
+        being rendered once all the rows are known. sortby_index is ignored
+        when streaming. Other output formats are always streamed.
     """
     formatters = formatters or {}
     mixed_case_fields = mixed_case_fields or []
@@ -158,35 +253,42 @@ def print_list(objs, fields, formatters=None, sortby_index=0,
         raise ValueError(_("Field labels list %(labels)s has different number "
                            "of elements than fields list %(fields)s"),
                          {'labels': field_labels, 'fields': fields})
-
-    if sortby_index is None:
-        kwargs = {}
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(_("Unknown output format %(format)s, expected one "
+                           "of: %(formats)s") %
+                         {'format': output_format,
+                          'formats': pretty_choice_list(OUTPUT_FORMATS)})
+
+    rows = _iter_rows(objs, fields, formatters, mixed_case_fields)
+
+    if output_format == 'jsonl':
+        for row in rows:
+            _print(json.dumps(dict(zip(fields, row))))
+    elif output_format == 'json':
+        sep = '['
+        for row in rows:
+            _print(sep + json.dumps(dict(zip(fields, row))))
+            sep = ','
+        _print('[]' if sep == '[' else ']')
+    elif output_format == 'csv':
+        _print_csv(rows, field_labels)
+    elif output_format == 'value':
+        for row in rows:
+            _print(' '.join(six.text_type(v) for v in row))
+    elif stream:
+        _print_stream_table(rows, field_labels, STREAM_SAMPLE_SIZE)
     else:
-        kwargs = {'sortby': field_labels[sortby_index]}
-    pt = prettytable.PrettyTable(field_labels)
-    pt.align = 'l'
+        if sortby_index is None:
+            kwargs = {}
+        else:
+            kwargs = {'sortby': field_labels[sortby_index]}
+        pt = prettytable.PrettyTable(field_labels)
+        pt.align = 'l'
 
-    for o in objs:
-        row = []
-        for field in fields:
-            if field in formatters:
-                row.append(formatters[field](o))
-            else:
-                if field in mixed_case_fields:
-                    field_name = field.replace(' ', '_')
-                else:
-                    field_name = field.lower().replace(' ', '_')
-                if isinstance(o, dict):
-                    data = o.get(field_name, '')
-                else:
-                    data = getattr(o, field_name, '')
-                row.append(data)
-        pt.add_row(row)
+        for row in rows:
+            pt.add_row(row)
 
-    if six.PY3:
-        print(encodeutils.safe_encode(pt.get_string(**kwargs)).decode())
-    else:
-        print(encodeutils.safe_encode(pt.get_string(**kwargs)))
+        _print(pt.get_string(**kwargs))
 
 
 def print_dict(dct, dict_property="Property", wrap=0, dict_value='Value'):
@@ -174,6 +174,52 @@ def common_params_for_list(args, fields, field_labels):
     return params
 
 
+def iter_list(list_func, *args, **params):
+    """Iterate over a listing, one page at a time.
+
+    Unlike calling list_func with limit=0, which only returns once every
+    page has been fetched, the resources of each page are yielded as soon
+    as the page arrives. Pages are requested with the marker of the last
+    resource of the previous page, and have the size imposed by the Ironic
+    API (see Ironic's api.max_limit option).
+
+    :param list_func: A manager's listing method, eg NodeManager.list.
+    :param args: Positional arguments for list_func.
+    :param params: Keyword arguments for list_func. A 'limit' is ignored;
+                   all the resources are returned.
+    :returns: A generator of resources.
+    """
+    params.pop('limit', None)
+    page_size = None
+    while True:
+        page = list_func(*args, **params)
+        for obj in page:
+            yield obj
+        # NOTE: a short page is the last one. A full page may be followed
+        # by an empty one.
+        if not page or (page_size is not None and len(page) < page_size):
+            return
+        page_size = page_size or len(page)
+        params['marker'] = page[-1].uuid
+
+
+def list_for_output(list_func, *args, **params):
+    """Call a listing method for the shell.
+
+    Listings without a limit (limit=0) are iterated one page at a time
+    (see iter_list), so that they can be printed as the pages arrive.
+
+    :param list_func: A manager's listing method, eg NodeManager.list.
+    :param args: Positional arguments for list_func.
+    :param params: Keyword arguments for list_func.
+    :returns: A tuple of (resources, stream) where stream tells whether
+              resources is an iterator that should be printed as it goes.
+    """
+    if params.get('limit') == 0:
+        return iter_list(list_func, *args, **params), True
+    return list_func(*args, **params), False
+
+
 def common_filters(marker=None, limit=None, sort_key=None, sort_dir=None,
                    fields=None):
     """Generate common filters for any list request.
@@ -304,3 +350,22 @@ def check_for_invalid_fields(fields, valid_fields):
             _('Invalid field(s) requested: %(invalid)s. Valid fields '
               'are: %(valid)s.') % {'invalid': ', '.join(invalid_fields),
                                     'valid': ', '.join(valid_fields)})
+
+
+def normalize_mac(address):
+    """Normalize a MAC address to the form stored by the Ironic API.
+
+    Accepts colon, dash or dot separated addresses in any case (for example
+    'AA-BB-CC-DD-EE-FF' or 'aabb.ccdd.eeff') and returns the lower-case,
+    colon-separated form.
+
+    :param address: The MAC address to normalize.
+    :raises: InvalidAttribute if the address is not a valid MAC address.
+    :returns: The normalized MAC address.
+    """
+    digits = address.strip().lower()
+    for sep in (':', '-', '.'):
+        digits = digits.replace(sep, '')
+    if len(digits) != 12 or any(c not in '0123456789abcdef' for c in digits):
+        raise exc.InvalidAttribute(_('Invalid MAC address: %s') % address)
+    return ':'.join(digits[i:i + 2] for i in range(0, 12, 2))
@@ -55,6 +55,14 @@ fake_responses = {
             CREATE_TESTABLE_RESOURCE,
         ),
     },
+    '/v1/testableresources/%s?fields=attribute1,uuid' % (
+        TESTABLE_RESOURCE['uuid']):
+    {
+        'GET': (
+            {},
+            TESTABLE_RESOURCE,
+        ),
+    },
     '/v1/testableresources/%s' % TESTABLE_RESOURCE['uuid']:
     {
         'GET': (
@@ -155,3 +163,64 @@ class ManagerTestCase(testtools.TestCase):
         ]
         self.assertEqual(expect, self.api.calls)
         self.assertIsNone(resource)
+
+
+class FieldProfileTestCase(testtools.TestCase):
+
+    def setUp(self):
+        super(FieldProfileTestCase, self).setUp()
+        self.api = utils.FakeAPI(fake_responses)
+        self.manager = TestableManager(self.api)
+        self.profile = base.FieldProfile(name='test')
+        self.manager.field_profile = self.profile
+        self.key = 'test:testableresources.get'
+
+    def test_record(self):
+        resource = self.manager.get(TESTABLE_RESOURCE['uuid'])
+        self.assertEqual(TESTABLE_RESOURCE['attribute1'], resource.attribute1)
+        self.assertIsInstance(resource, TestableResource)
+        self.assertEqual({self.key: ['attribute1']}, self.profile.export())
+        # recording does not narrow requests until the profile is frozen
+        self.manager.get(TESTABLE_RESOURCE['uuid'])
+        self.assertEqual('/v1/testableresources/%s' %
+                         TESTABLE_RESOURCE['uuid'], self.api.calls[-1][1])
+
+    def test_frozen(self):
+        self.manager.get(TESTABLE_RESOURCE['uuid']).attribute1
+        self.profile.freeze()
+        resource = self.manager.get(TESTABLE_RESOURCE['uuid'])
+        resource.attribute2
+        self.assertEqual('/v1/testableresources/%s?fields=attribute1,uuid' %
+                         TESTABLE_RESOURCE['uuid'], self.api.calls[-1][1])
+        self.assertEqual({self.key: ['attribute1']}, self.profile.export())
+
+    def test_load_exported(self):
+        profile = base.FieldProfile(fields={self.key: ['attribute1']},
+                                    name='test', frozen=True)
+        self.manager.field_profile = profile
+        self.manager.get(TESTABLE_RESOURCE['uuid'])
+        self.assertEqual('/v1/testableresources/%s?fields=attribute1,uuid' %
+                         TESTABLE_RESOURCE['uuid'], self.api.calls[-1][1])
+
+    def test_warmup(self):
+        self.profile.warmup = 1
+        self.manager.get(TESTABLE_RESOURCE['uuid']).attribute1
+        resource = self.manager.get(TESTABLE_RESOURCE['uuid'])
+        self.assertEqual('/v1/testableresources/%s?fields=attribute1,uuid' %
+                         TESTABLE_RESOURCE['uuid'], self.api.calls[-1][1])
+        # attributes missing from narrowed responses widen later requests
+        self.assertRaises(AttributeError, getattr, resource, 'attribute3')
+        self.assertEqual(['attribute1', 'attribute3'],
+                         self.profile.export()[self.key])
+
+    def test_call_site_key(self):
+        self.profile.name = None
+        key = self.profile.key('testableresources', 'get')
+        self.assertTrue(key.startswith(__file__.rstrip('c') + ':'))
+        self.assertTrue(key.endswith(':testableresources.get'))
+
+    def test_explicit_fields_not_profiled(self):
+        resource = self.manager.get(TESTABLE_RESOURCE['uuid'],
+                                    fields=['attribute1', 'uuid'])
+        resource.uuid
+        self.assertEqual({}, self.profile.export())
@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 import sys
 
 import fixtures
@@ -585,6 +586,77 @@ class PrintResultStringTestCase(test_base.BaseTestCase):
 '''
         self.assertEqual(expected, out)
 
+    def _print_list(self, objs, **kwargs):
+        orig = sys.stdout
+        sys.stdout = six.StringIO()
+        cliutils.print_list(objs, ["Name", "Value"], sortby_index=None,
+                            **kwargs)
+        out = sys.stdout.getvalue()
+        sys.stdout.close()
+        sys.stdout = orig
+        return out
+
+    def test_print_list_stream(self):
+        objs = iter([_FakeResult("k1", 1), _FakeResult("k2", 10)])
+        out = self._print_list(objs, stream=True)
+        expected = '''\
++------+-------+
+| Name | Value |
++------+-------+
+| k1   | 1     |
+| k2   | 10    |
++------+-------+
+'''
+        self.assertEqual(expected, out)
+
+    def test_print_list_stream_sample(self):
+        self.useFixture(fixtures.MonkeyPatch(
+            'ironicclient.common.cliutils.STREAM_SAMPLE_SIZE', 1))
+        objs = iter([_FakeResult("k1", 1), _FakeResult("k2", 1234567)])
+        out = self._print_list(objs, stream=True)
+        expected = '''\
++------+-------+
+| Name | Value |
++------+-------+
+| k1   | 1     |
+| k2   | 1234567 |
++------+-------+
+'''
+        self.assertEqual(expected, out)
+
+    def test_print_list_json(self):
+        objs = [_FakeResult("k1", 1), _FakeResult("k2", {"a": "b"})]
+        out = self._print_list(objs, output_format='json')
+        self.assertEqual([{"Name": "k1", "Value": 1},
+                          {"Name": "k2", "Value": {"a": "b"}}],
+                         json.loads(out))
+
+    def test_print_list_json_empty(self):
+        out = self._print_list([], output_format='json')
+        self.assertEqual([], json.loads(out))
+
+    def test_print_list_jsonl(self):
+        objs = [_FakeResult("k1", 1), _FakeResult("k2", 2)]
+        out = self._print_list(objs, output_format='jsonl')
+        self.assertEqual([{"Name": "k1", "Value": 1},
+                          {"Name": "k2", "Value": 2}],
+                         [json.loads(l) for l in out.splitlines()])
+
+    def test_print_list_csv(self):
+        objs = [_FakeResult("k,1", 1), _FakeResult("k2", [1, 2])]
+        out = self._print_list(objs, output_format='csv',
+                               field_labels=["A Name", "A Value"])
+        self.assertEqual('A Name,A Value\n"k,1",1\nk2,"[1, 2]"\n', out)
+
+    def test_print_list_value(self):
+        objs = [_FakeResult("k1", 1), _FakeResult("k2", 2)]
+        out = self._print_list(objs, output_format='value')
+        self.assertEqual('k1 1\nk2 2\n', out)
+
+    def test_print_list_unknown_format(self):
+        self.assertRaises(ValueError, cliutils.print_list, [], ["Name"],
+                          output_format='yaml')
+
     def test_print_dict_string(self):
         orig = sys.stdout
         sys.stdout = six.StringIO()
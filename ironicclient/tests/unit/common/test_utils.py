@@ -122,6 +122,54 @@ class UtilsTest(test_utils.BaseTestCase):
                           ['a', 'd'], ['a', 'b', 'c'])
 
 
+class IterListTest(test_utils.BaseTestCase):
+
+    def _list_func(self, pages):
+        pages = [[mock.Mock(uuid=u) for u in page] for page in pages]
+        return mock.Mock(side_effect=pages)
+
+    def test_iter_list(self):
+        list_func = self._list_func([['a', 'b'], ['c']])
+        result = utils.iter_list(list_func, 'node', limit=0, detail=True)
+        self.assertEqual(['a', 'b', 'c'], [r.uuid for r in result])
+        self.assertEqual([mock.call('node', detail=True),
+                          mock.call('node', detail=True, marker='b')],
+                         list_func.call_args_list)
+
+    def test_iter_list_full_last_page(self):
+        list_func = self._list_func([['a', 'b'], ['c', 'd'], []])
+        result = utils.iter_list(list_func)
+        self.assertEqual(['a', 'b', 'c', 'd'], [r.uuid for r in result])
+        self.assertEqual(3, list_func.call_count)
+
+    def test_list_for_output(self):
+        list_func = mock.Mock(return_value=[])
+        self.assertEqual(([], False),
+                         utils.list_for_output(list_func, limit=5))
+        list_func.assert_called_once_with(limit=5)
+
+    def test_list_for_output_stream(self):
+        list_func = self._list_func([['a']])
+        result, stream = utils.list_for_output(list_func, limit=0)
+        self.assertTrue(stream)
+        self.assertFalse(list_func.called)
+        self.assertEqual(['a'], [r.uuid for r in result])
+
+
+class NormalizeMacTest(test_utils.BaseTestCase):
+
+    def test_normalize_mac(self):
+        for address in ('AA:BB:CC:DD:EE:FF', 'aa-bb-cc-dd-ee-ff',
+                        'aabb.ccdd.eeff', ' aabbccddeeff '):
+            self.assertEqual('aa:bb:cc:dd:ee:ff',
+                             utils.normalize_mac(address))
+
+    def test_normalize_mac_invalid(self):
+        for address in ('', 'aa:bb:cc:dd:ee', 'gg:bb:cc:dd:ee:ff'):
+            self.assertRaises(exc.InvalidAttribute, utils.normalize_mac,
+                              address)
+
+
 class CommonParamsForListTest(test_utils.BaseTestCase):
     def setUp(self):
         super(CommonParamsForListTest, self).setUp()
@@ -36,6 +36,7 @@ class ChassisShellTest(utils.BaseTestCase):
         args.sort_key = sort_key
         args.detail = detail
         args.fields = fields
+        args.output_format = 'table'
         args.associated = associated
         args.maintenance = maintenance
         args.provision_state = provision_state
@@ -115,6 +115,7 @@ class DriverShellTest(utils.BaseTestCase):
     def test_do_driver_list(self):
         client_mock = self.client_mock
         args = mock.MagicMock()
+        args.output_format = 'table'
 
         d_shell.do_driver_list(client_mock, args)
         client_mock.driver.list.assert_called_once_with()
@@ -19,6 +19,7 @@ import mock
 import testtools
 from testtools.matchers import HasLength
 
+from ironicclient.common import base
 from ironicclient.common import utils as common_utils
 from ironicclient import exc
 from ironicclient.tests.unit import utils
@@ -117,6 +118,13 @@ fake_responses = {
             {"nodes": [NODE1, NODE2]}
         ),
     },
+    '/v1/nodes/?fields=extra,uuid':
+    {
+        'GET': (
+            {},
+            {"nodes": [NODE1]},
+        ),
+    },
     '/v1/nodes/?fields=uuid,extra':
     {
         'GET': (
@@ -611,6 +619,16 @@ class NodeManagerTest(testtools.TestCase):
         self.assertEqual(expect, self.api.calls)
         self.assertEqual(1, len(nodes))
 
+    def test_node_list_field_profile(self):
+        self.mgr.field_profile = base.FieldProfile(
+            fields={'test:nodes.list': ['extra']}, name='test', frozen=True)
+        nodes = self.mgr.list(detail=True)
+        expect = [
+            ('GET', '/v1/nodes/?fields=extra,uuid', {}, None),
+        ]
+        self.assertEqual(expect, self.api.calls)
+        self.assertEqual(1, len(nodes))
+
     def test_node_list_detail_and_fields_fail(self):
         self.assertRaises(exc.InvalidAttribute, self.mgr.list,
                           detail=True, fields=['uuid', 'extra'])
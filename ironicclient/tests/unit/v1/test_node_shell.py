@@ -654,6 +654,7 @@ class NodeShellTest(utils.BaseTestCase):
         args.sort_key = sort_key
         args.detail = detail
         args.fields = fields
+        args.output_format = 'table'
 
         return args
 
@@ -664,6 +665,21 @@ class NodeShellTest(utils.BaseTestCase):
         n_shell.do_node_list(client_mock, args)
         client_mock.node.list.assert_called_once_with(detail=False)
 
+    @mock.patch.object(cliutils, 'print_list', autospec=True)
+    def test_do_node_list_stream(self, mock_print_list):
+        client_mock = mock.MagicMock()
+        client_mock.node.list.return_value = []
+        args = self._get_client_mock_args(limit=0)
+        args.output_format = 'jsonl'
+
+        n_shell.do_node_list(client_mock, args)
+        self.assertFalse(client_mock.node.list.called)
+        kwargs = mock_print_list.call_args[1]
+        self.assertEqual('jsonl', kwargs['output_format'])
+        self.assertTrue(kwargs['stream'])
+        list(mock_print_list.call_args[0][0])
+        client_mock.node.list.assert_called_once_with(detail=False)
+
     def test_do_node_list_detail(self):
         client_mock = mock.MagicMock()
         args = self._get_client_mock_args(detail=True)
@@ -140,6 +140,40 @@ fake_responses_pagination = {
     },
 }
 
+fake_responses_resolve = {
+    '/v1/ports/?fields=uuid,address,node_uuid&address=%s' % (
+        PORT['address'].lower()):
+    {
+        'GET': (
+            {},
+            {"ports": [PORT]},
+        ),
+    },
+    '/v1/ports/?fields=uuid,address,node_uuid&address=%s' % (
+        PORT2['address'].lower()):
+    {
+        'GET': (
+            {},
+            {"ports": []},
+        ),
+    },
+    '/v1/ports/?fields=uuid,address,node_uuid':
+    {
+        'GET': (
+            {},
+            {"ports": [PORT],
+             "next": "http://127.0.0.1:6385/v1/ports/?limit=1"}
+        ),
+    },
+    '/v1/ports/?limit=1':
+    {
+        'GET': (
+            {},
+            {"ports": [PORT2]}
+        ),
+    },
+}
+
 fake_responses_sorting = {
     '/v1/ports/?sort_key=updated_at':
     {
@@ -333,3 +367,36 @@ class PortManagerTest(testtools.TestCase):
         ]
         self.assertEqual(expect, self.api.calls)
         self.assertEqual(NEW_ADDR, port.address)
+
+    def test_resolve_addresses_per_address(self):
+        self.api = utils.FakeAPI(fake_responses_resolve)
+        self.mgr = ironicclient.v1.port.PortManager(self.api)
+        ports = self.mgr.resolve_addresses(['aa-bb-cc-dd-ee-ff',
+                                            'AA:AA:AA:BB:BB:BB'])
+        self.assertEqual(2, len(self.api.calls))
+        self.assertEqual([PORT['address'].lower()], list(ports))
+        self.assertEqual(PORT['uuid'], ports['aa:bb:cc:dd:ee:ff'].uuid)
+
+    def test_resolve_addresses_sweep(self):
+        self.api = utils.FakeAPI(fake_responses_resolve)
+        self.mgr = ironicclient.v1.port.PortManager(self.api)
+        ports = self.mgr.resolve_addresses(['aabb.ccdd.eeff',
+                                            'AA:AA:AA:BB:BB:BB',
+                                            '00:00:00:00:00:01'],
+                                           threshold=2)
+        expect = [
+            ('GET', '/v1/ports/?fields=uuid,address,node_uuid', {}, None),
+            ('GET', '/v1/ports/?limit=1', {}, None),
+        ]
+        self.assertEqual(expect, self.api.calls)
+        self.assertEqual(PORT['uuid'], ports['aa:bb:cc:dd:ee:ff'].uuid)
+        self.assertEqual(PORT2['uuid'], ports['aa:aa:aa:bb:bb:bb'].uuid)
+        self.assertEqual(2, len(ports))
+
+    def test_resolve_addresses_empty(self):
+        self.assertEqual({}, self.mgr.resolve_addresses([]))
+        self.assertEqual([], self.api.calls)
+
+    def test_resolve_addresses_invalid(self):
+        self.assertRaises(exc.InvalidAttribute, self.mgr.resolve_addresses,
+                          ['not-a-mac'])
@@ -133,6 +133,7 @@ class PortShellTest(utils.BaseTestCase):
         args.sort_key = sort_key
         args.detail = detail
         args.fields = fields
+        args.output_format = 'table'
 
         return args
 
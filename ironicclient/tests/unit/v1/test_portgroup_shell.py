@@ -102,6 +102,7 @@ class PortgroupShellTest(utils.BaseTestCase):
         args.sort_key = sort_key
         args.detail = detail
         args.fields = fields
+        args.output_format = 'table'
 
         return args
 
@@ -0,0 +1,108 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import testtools
+
+from ironicclient.tests.unit import utils
+from ironicclient.v1 import chassis
+from ironicclient.v1 import node
+from ironicclient.v1 import port
+from ironicclient.v1 import portgroup
+from ironicclient.v1 import topology
+
+CHASSIS = {'uuid': 'c-1'}
+NODE1 = {'uuid': 'n-1', 'chassis_uuid': 'c-1'}
+NODE2 = {'uuid': 'n-2', 'chassis_uuid': None}
+PORTGROUP = {'uuid': 'pg-1', 'node_uuid': 'n-1'}
+PORT1 = {'uuid': 'p-1', 'node_uuid': 'n-1', 'portgroup_uuid': 'pg-1'}
+PORT2 = {'uuid': 'p-2', 'node_uuid': 'n-1', 'portgroup_uuid': None}
+PORT3 = {'uuid': 'p-3', 'node_uuid': 'n-2', 'portgroup_uuid': None}
+
+fake_responses = {
+    '/v1/chassis/detail':
+    {
+        'GET': (
+            {},
+            {"chassis": [CHASSIS]},
+        ),
+    },
+    '/v1/nodes/detail':
+    {
+        'GET': (
+            {},
+            {"nodes": [NODE1],
+             "next": "http://127.0.0.1:6385/v1/nodes/detail?marker=n-1"},
+        ),
+    },
+    '/v1/nodes/detail?marker=n-1':
+    {
+        'GET': (
+            {},
+            {"nodes": [NODE2]},
+        ),
+    },
+    '/v1/ports/detail':
+    {
+        'GET': (
+            {},
+            {"ports": [PORT1, PORT2, PORT3]},
+        ),
+    },
+    '/v1/portgroups/detail':
+    {
+        'GET': (
+            {},
+            {"portgroups": [PORTGROUP]},
+        ),
+    },
+}
+
+
+class FakeClient(object):
+    def __init__(self, api):
+        self.chassis = chassis.ChassisManager(api)
+        self.node = node.NodeManager(api)
+        self.port = port.PortManager(api)
+        self.portgroup = portgroup.PortgroupManager(api)
+
+
+class TopologyTest(testtools.TestCase):
+
+    def setUp(self):
+        super(TopologyTest, self).setUp()
+        self.api = utils.FakeAPI(fake_responses)
+        self.topology = topology.get_topology(FakeClient(self.api))
+
+    def test_requests(self):
+        self.assertEqual(sorted(fake_responses),
+                         sorted(call[1] for call in self.api.calls))
+
+    def test_resources(self):
+        self.assertEqual(['c-1'], list(self.topology.chassis))
+        self.assertEqual(['n-1', 'n-2'], list(self.topology.nodes))
+        self.assertEqual(['p-1', 'p-2', 'p-3'], list(self.topology.ports))
+        self.assertEqual(['pg-1'], list(self.topology.portgroups))
+
+    def test_adjacency(self):
+        self.assertEqual(['n-1'], [n.uuid for n in
+                                   self.topology.nodes_for_chassis('c-1')])
+        self.assertEqual(['n-2'], [n.uuid for n in
+                                   self.topology.nodes_for_chassis(None)])
+        self.assertEqual(['p-1', 'p-2'],
+                         [p.uuid for p in self.topology.ports_for_node('n-1')])
+        self.assertEqual(['pg-1'],
+                         [pg.uuid for pg in
+                          self.topology.portgroups_for_node('n-1')])
+        self.assertEqual(['p-1'],
+                         [p.uuid for p in
+                          self.topology.ports_for_portgroup('pg-1')])
+        self.assertEqual([], self.topology.ports_for_node('unknown'))
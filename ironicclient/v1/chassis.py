@@ -68,6 +68,9 @@ class ChassisManager(base.CreateManager):
             raise exc.InvalidAttribute(_("Can't fetch a subset of fields "
                                          "with 'detail' set"))
 
+        fields, detail, profile_key = self._profile_fields(
+            'list', fields, detail)
+
         filters = utils.common_filters(marker, limit, sort_key, sort_dir,
                                        fields)
 
@@ -78,10 +81,12 @@ class ChassisManager(base.CreateManager):
             path += '?' + '&'.join(filters)
 
         if limit is None:
-            return self._list(self._path(path), "chassis")
+            return self._list(self._path(path), "chassis",
+                              profile_key=profile_key)
         else:
             return self._list_pagination(self._path(path), "chassis",
-                                         limit=limit)
+                                         limit=limit,
+                                         profile_key=profile_key)
 
     def list_nodes(self, chassis_id, marker=None, limit=None,
                    sort_key=None, sort_dir=None, detail=False, fields=None,
@@ -83,6 +83,7 @@ def do_chassis_show(cc, args):
     default=[],
     help="One or more chassis fields. Only these fields will be fetched from "
          "the server. Can not be used when '--detail' is specified.")
+@cliutils.output_format_arg
 def do_chassis_list(cc, args):
     """List the chassis."""
     if args.detail:
@@ -104,10 +105,12 @@ def do_chassis_list(cc, args):
     params = utils.common_params_for_list(args, sort_fields,
                                           sort_field_labels)
 
-    chassis = cc.chassis.list(**params)
+    chassis, stream = utils.list_for_output(cc.chassis.list, **params)
     cliutils.print_list(chassis, fields,
                         field_labels=field_labels,
-                        sortby_index=None)
+                        sortby_index=None,
+                        output_format=args.output_format,
+                        stream=stream)
 
 
 @cliutils.arg(
@@ -218,6 +221,7 @@ def do_chassis_update(cc, args):
     '--provision-state',
     metavar='<provision-state>',
     help="List nodes in specified provision state.")
+@cliutils.output_format_arg
 def do_chassis_node_list(cc, args):
     """List the nodes contained in a chassis."""
     params = {}
@@ -250,7 +254,10 @@ def do_chassis_node_list(cc, args):
                                                sort_fields,
                                                sort_field_labels))
 
-    nodes = cc.chassis.list_nodes(args.chassis, **params)
+    nodes, stream = utils.list_for_output(cc.chassis.list_nodes,
+                                          args.chassis, **params)
     cliutils.print_list(nodes, fields,
                         field_labels=field_labels,
-                        sortby_index=None)
+                        sortby_index=None,
+                        output_format=args.output_format,
+                        stream=stream)
@@ -21,6 +21,7 @@ from ironicclient.v1 import driver
 from ironicclient.v1 import node
 from ironicclient.v1 import port
 from ironicclient.v1 import portgroup
+from ironicclient.v1 import topology
 
 
 class Client(object):
@@ -31,10 +32,15 @@ class Client(object):
     :param function token: Provides token for authentication.
     :param integer timeout: Allows customization of the timeout for client
                             http requests. (optional)
+    :param field_profile: A :class:`ironicclient.common.base.FieldProfile`
+                          recording the attributes read from the returned
+                          resources, used to narrow the fields requested.
+                          (optional)
     """
 
     def __init__(self, *args, **kwargs):
         """Initialize a new client for the Ironic v1 API."""
+        field_profile = kwargs.pop('field_profile', None)
         if kwargs.get('os_ironic_api_version'):
             kwargs['api_version_select_state'] = "user"
         else:
@@ -56,3 +62,15 @@ class Client(object):
         self.port = port.PortManager(self.http_client)
         self.driver = driver.DriverManager(self.http_client)
         self.portgroup = portgroup.PortgroupManager(self.http_client)
+
+        if field_profile is not None:
+            for manager in (self.chassis, self.node, self.port,
+                            self.portgroup):
+                manager.field_profile = field_profile
+
+    def topology(self):
+        """Return the chassis -> nodes -> ports/portgroups graph.
+
+        :returns: A :class:`ironicclient.v1.topology.Topology` object.
+        """
+        return topology.get_topology(self)
@@ -26,6 +26,7 @@ def _print_driver_show(driver):
     cliutils.print_dict(data, wrap=72)
 
 
+@cliutils.output_format_arg
 def do_driver_list(cc, args):
     """List the enabled drivers."""
     drivers = cc.driver.list()
@@ -35,7 +36,8 @@ def do_driver_list(cc, args):
         d.hosts = ', '.join(d.hosts)
     field_labels = ['Supported driver(s)', 'Active host(s)']
     fields = ['name', 'hosts']
-    cliutils.print_list(drivers, fields, field_labels=field_labels)
+    cliutils.print_list(drivers, fields, field_labels=field_labels,
+                        output_format=args.output_format)
 
 
 @cliutils.arg('driver_name', metavar='<driver>',
@@ -91,6 +91,9 @@ class NodeManager(base.CreateManager):
             raise exc.InvalidAttribute(_("Can't fetch a subset of fields "
                                          "with 'detail' set"))
 
+        fields, detail, profile_key = self._profile_fields(
+            'list', fields, detail)
+
         filters = utils.common_filters(marker, limit, sort_key, sort_dir,
                                        fields)
         if associated is not None:
@@ -107,10 +110,12 @@ class NodeManager(base.CreateManager):
             path += '?' + '&'.join(filters)
 
         if limit is None:
-            return self._list(self._path(path), "nodes")
+            return self._list(self._path(path), "nodes",
+                              profile_key=profile_key)
         else:
             return self._list_pagination(self._path(path), "nodes",
-                                         limit=limit)
+                                         limit=limit,
+                                         profile_key=profile_key)
 
     def list_ports(self, node_id, marker=None, limit=None, sort_key=None,
                    sort_dir=None, detail=False, fields=None):
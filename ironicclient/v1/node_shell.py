@@ -158,6 +158,7 @@ def do_node_show(cc, args):
     default=[],
     help="One or more node fields. Only these fields will be fetched from "
          "the server. Can not be used when '--detail' is specified.")
+@cliutils.output_format_arg
 def do_node_list(cc, args):
     """List the nodes which are registered with the Ironic service."""
     params = {}
@@ -189,10 +190,12 @@ def do_node_list(cc, args):
     params.update(utils.common_params_for_list(args,
                                                sort_fields,
                                                sort_field_labels))
-    nodes = cc.node.list(**params)
+    nodes, stream = utils.list_for_output(cc.node.list, **params)
     cliutils.print_list(nodes, fields,
                         field_labels=field_labels,
-                        sortby_index=None)
+                        sortby_index=None,
+                        output_format=args.output_format,
+                        stream=stream)
 
 
 @cliutils.arg(
@@ -368,6 +371,7 @@ def do_node_vendor_passthru(cc, args):
     default=[],
     help="One or more port fields. Only these fields will be fetched from "
          "the server. Can not be used when '--detail' is specified.")
+@cliutils.output_format_arg
 def do_node_port_list(cc, args):
     """List the ports associated with a node."""
     if args.detail:
@@ -389,10 +393,13 @@ def do_node_port_list(cc, args):
     params = utils.common_params_for_list(args, sort_fields,
                                           sort_field_labels)
 
-    ports = cc.node.list_ports(args.node, **params)
+    ports, stream = utils.list_for_output(cc.node.list_ports,
+                                          args.node, **params)
     cliutils.print_list(ports, fields,
                         field_labels=field_labels,
-                        sortby_index=None)
+                        sortby_index=None,
+                        output_format=args.output_format,
+                        stream=stream)
 
 
 @cliutils.arg(
@@ -433,6 +440,7 @@ def do_node_port_list(cc, args):
     default=[],
     help="One or more portgroup fields. Only these fields will be fetched "
          "from the server. Can not be used when '--detail' is specified.")
+@cliutils.output_format_arg
 def do_node_portgroup_list(cc, args):
     """List the portgroups associated with a node."""
     if args.detail:
@@ -450,10 +458,13 @@ def do_node_portgroup_list(cc, args):
 
     params = utils.common_params_for_list(args, fields, field_labels)
 
-    portgroups = cc.node.list_portgroups(args.node, **params)
+    portgroups, stream = utils.list_for_output(
+        cc.node.list_portgroups, args.node, **params)
     cliutils.print_list(portgroups, fields,
                         field_labels=field_labels,
-                        sortby_index=None)
+                        sortby_index=None,
+                        output_format=args.output_format,
+                        stream=stream)
 
 
 @cliutils.arg('node', metavar='<node>', help="Name or UUID of the node.")
@@ -20,6 +20,15 @@ from ironicclient.common import utils
 from ironicclient import exc
 
 
+# NOTE: Batches of up to this many addresses are resolved with one
+# '?address=' request each; larger batches are resolved from a single
+# paginated sweep over all the ports, which is cheaper than issuing one
+# request per address once the batch grows past a page or so of results.
+RESOLVE_SWEEP_THRESHOLD = 8
+
+_RESOLVE_FIELDS = ['uuid', 'address', 'node_uuid']
+
+
 class Port(base.Resource):
     def __repr__(self):
         return "<Port %s>" % self._info
@@ -72,6 +81,9 @@ class PortManager(base.CreateManager):
             raise exc.InvalidAttribute(_("Can't fetch a subset of fields "
                                          "with 'detail' set"))
 
+        fields, detail, profile_key = self._profile_fields(
+            'list', fields, detail)
+
         filters = utils.common_filters(marker, limit, sort_key, sort_dir,
                                        fields)
         if address is not None:
@@ -84,10 +96,12 @@ class PortManager(base.CreateManager):
             path += '?' + '&'.join(filters)
 
         if limit is None:
-            return self._list(self._path(path), "ports")
+            return self._list(self._path(path), "ports",
+                              profile_key=profile_key)
         else:
             return self._list_pagination(self._path(path), "ports",
-                                         limit=limit)
+                                         limit=limit,
+                                         profile_key=profile_key)
 
     def get(self, port_id, fields=None):
         return self._get(resource_id=port_id, fields=fields)
@@ -107,6 +121,53 @@ class PortManager(base.CreateManager):
         else:
             raise exc.NotFound()
 
+    def resolve_addresses(self, addresses, fields=None, threshold=None):
+        """Resolve a batch of MAC addresses to ports.
+
+        Small batches are resolved with one request per address, larger
+        ones by building an address index from a single paginated listing
+        of all the ports.
+
+        :param addresses: An iterable of MAC addresses. They are normalized
+                          before lookup, so any case and separator is
+                          accepted.
+        :param fields: Optional, a list with a specified set of fields
+                       of the ports to be returned. Defaults to 'uuid',
+                       'address' and 'node_uuid'; 'address' is always
+                       fetched.
+        :param threshold: Optional, the maximum number of addresses that
+                          are resolved with per-address requests. Defaults
+                          to RESOLVE_SWEEP_THRESHOLD.
+        :raises: InvalidAttribute if an address is not a valid MAC address.
+        :returns: A dictionary mapping each normalized address to its
+                  :class:`Port`. Addresses without a port are omitted.
+
+        """
+        wanted = set(utils.normalize_mac(a) for a in addresses)
+        if not wanted:
+            return {}
+
+        fields = list(fields or _RESOLVE_FIELDS)
+        if 'address' not in fields:
+            fields.append('address')
+        if threshold is None:
+            threshold = RESOLVE_SWEEP_THRESHOLD
+
+        if len(wanted) <= threshold:
+            result = {}
+            for address in wanted:
+                ports = self.list(address=address, fields=fields)
+                if ports:
+                    result[address] = ports[0]
+            return result
+
+        result = {}
+        for port in self.list(limit=0, fields=fields):
+            address = utils.normalize_mac(port.address)
+            if address in wanted:
+                result[address] = port
+        return result
+
     def delete(self, port_id):
         return self._delete(resource_id=port_id)
 
@@ -98,6 +98,7 @@ def do_port_show(cc, args):
     default=[],
     help="One or more port fields. Only these fields will be fetched from "
          "the server. Can not be used when '--detail' is specified.")
+@cliutils.output_format_arg
 def do_port_list(cc, args):
     """List the ports."""
     params = {}
@@ -125,10 +126,12 @@ def do_port_list(cc, args):
                                                sort_fields,
                                                sort_field_labels))
 
-    port = cc.port.list(**params)
+    port, stream = utils.list_for_output(cc.port.list, **params)
     cliutils.print_list(port, fields,
                         field_labels=field_labels,
-                        sortby_index=None)
+                        sortby_index=None,
+                        output_format=args.output_format,
+                        stream=stream)
 
 
 @cliutils.arg(
@@ -72,6 +72,9 @@ class PortgroupManager(base.CreateManager):
             raise exc.InvalidAttribute(_("Can't fetch a subset of fields "
                                          "with 'detail' set"))
 
+        fields, detail, profile_key = self._profile_fields(
+            'list', fields, detail)
+
         filters = utils.common_filters(marker, limit, sort_key, sort_dir,
                                        fields)
         if address is not None:
@@ -86,10 +89,12 @@ class PortgroupManager(base.CreateManager):
             path += '?' + '&'.join(filters)
 
         if limit is None:
-            return self._list(self._path(path), "portgroups")
+            return self._list(self._path(path), "portgroups",
+                              profile_key=profile_key)
         else:
             return self._list_pagination(self._path(path), "portgroups",
-                                         limit=limit)
+                                         limit=limit,
+                                         profile_key=profile_key)
 
     def get(self, portgroup_id, fields=None):
         """Find a portgroup based on its id return a Portgroup object.
@@ -104,6 +104,7 @@ def do_portgroup_show(cc, args):
     default=[],
     help="One or more portgroup fields. Only these fields will be fetched "
          "from the server. Can not be used when '--detail' is specified.")
+@cliutils.output_format_arg
 def do_portgroup_list(cc, args):
     """List the port groups."""
     params = {}
@@ -133,10 +134,13 @@ def do_portgroup_list(cc, args):
                                                sort_fields,
                                                sort_field_labels))
 
-    portgroup = cc.portgroup.list(**params)
+    portgroup, stream = utils.list_for_output(cc.portgroup.list,
+                                              **params)
     cliutils.print_list(portgroup, fields,
                         field_labels=field_labels,
-                        sortby_index=None)
+                        sortby_index=None,
+                        output_format=args.output_format,
+                        stream=stream)
 
 
 @cliutils.arg(
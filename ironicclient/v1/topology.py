@@ -0,0 +1,91 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+In-memory graph of the physical topology: chassis, nodes, ports and
+port groups.
+"""
+
+import collections
+from multiprocessing import pool
+
+
+class Topology(object):
+    """The chassis -> nodes -> ports/portgroups graph.
+
+    Resources are indexed by UUID in the ``chassis``, ``nodes``, ``ports``
+    and ``portgroups`` dictionaries. The adjacency indexes map the UUID of
+    a parent resource to the list of UUIDs of its children; nodes that do
+    not belong to a chassis, and ports that do not belong to a port group,
+    are found under the ``None`` key.
+    """
+
+    def __init__(self, chassis, nodes, ports, portgroups):
+        self.chassis = collections.OrderedDict((c.uuid, c) for c in chassis)
+        self.nodes = collections.OrderedDict((n.uuid, n) for n in nodes)
+        self.ports = collections.OrderedDict((p.uuid, p) for p in ports)
+        self.portgroups = collections.OrderedDict((pg.uuid, pg)
+                                                  for pg in portgroups)
+
+        self.chassis_nodes = self._index(self.nodes, 'chassis_uuid')
+        self.node_ports = self._index(self.ports, 'node_uuid')
+        self.node_portgroups = self._index(self.portgroups, 'node_uuid')
+        self.portgroup_ports = self._index(self.ports, 'portgroup_uuid')
+
+    @staticmethod
+    def _index(resources, parent_attr):
+        index = collections.defaultdict(list)
+        for uuid, resource in resources.items():
+            index[getattr(resource, parent_attr, None)].append(uuid)
+        return index
+
+    def nodes_for_chassis(self, chassis_uuid):
+        """Return the nodes that belong to a chassis."""
+        return [self.nodes[u]
+                for u in self.chassis_nodes.get(chassis_uuid, [])]
+
+    def ports_for_node(self, node_uuid):
+        """Return the ports that belong to a node."""
+        return [self.ports[u] for u in self.node_ports.get(node_uuid, [])]
+
+    def portgroups_for_node(self, node_uuid):
+        """Return the port groups that belong to a node."""
+        return [self.portgroups[u]
+                for u in self.node_portgroups.get(node_uuid, [])]
+
+    def ports_for_portgroup(self, portgroup_uuid):
+        """Return the ports that belong to a port group."""
+        return [self.ports[u]
+                for u in self.portgroup_ports.get(portgroup_uuid, [])]
+
+
+def get_topology(client):
+    """Fetch the physical topology known to the Ironic service.
+
+    Instead of walking the graph level by level (one request per chassis
+    and per node), every resource type is fetched with a single paginated
+    detailed listing, and the four listings are issued concurrently. The
+    listings are then grouped on the client side by their 'chassis_uuid',
+    'node_uuid' and 'portgroup_uuid' attributes.
+
+    :param client: A v1 :class:`ironicclient.v1.client.Client`.
+    :returns: A :class:`Topology` object.
+    """
+    managers = (client.chassis, client.node, client.port, client.portgroup)
+    workers = pool.ThreadPool(len(managers))
+    try:
+        listings = workers.map(lambda mgr: mgr.list(limit=0, detail=True),
+                               managers)
+    finally:
+        workers.close()
+        workers.join()
+    return Topology(*listings)